@@ -17,9 +17,18 @@ interface ChatResponse {
   message: ChatMessage;
 }
 
-const openai = new OpenAI({
-  apiKey: openAIKey(),
-});
+let openai: OpenAI | null = null;
+
+// Lazily constructs the shared OpenAI client so importing this module
+// doesn't resolve the secret or build the client until the first request.
+const getOpenAI = (): OpenAI => {
+  if (!openai) {
+    openai = new OpenAI({
+      apiKey: openAIKey(),
+    });
+  }
+  return openai;
+};
 
 const SYSTEM_PROMPT = `You are an expert AI assistant specialized in helping developers create MCP (Model Context Protocol) Servers and Clients. 
 
@@ -175,7 +184,7 @@ export const chat = api<ChatRequest, ChatResponse>(
       }))
     ];
 
-    const completion = await openai.chat.completions.create({
+    const completion = await getOpenAI().chat.completions.create({
       model: "gpt-4o",
       messages,
       temperature: 0.7,
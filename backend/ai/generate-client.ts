@@ -21,6 +21,10 @@ export interface GenerateClientResponse {
   instructions: string;
 }
 
+// Project names are interpolated into package.json and generated source,
+// so restrict them to safe characters with one precompiled pattern.
+const PROJECT_NAME_PATTERN = /^[A-Za-z0-9_-]+$/;
+
 const generateFileSystemClient = (projectName: string, description?: string): ClientProjectFile[] => {
   const packageJson = {
     name: projectName,
@@ -2530,17 +2534,9 @@ npm run build
   ];
 };
 
-// Generates complete MCP client boilerplate code based on user requirements.
-export const generateClient = api<GenerateClientRequest, GenerateClientResponse>(
-  { expose: true, method: "POST", path: "/generate-client" },
-  async (req) => {
-    let files: ClientProjectFile[] = [];
-    let instructions = "";
-
-    switch (req.clientType) {
-      case "filesystem":
-        files = generateFileSystemClient(req.projectName, req.description);
-        instructions = `Your file system MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides a command-line interface for interacting with MCP file system servers.
+// Setup instructions are static per client type, so build each string once
+// at module load instead of on every request.
+const FILESYSTEM_CLIENT_INSTRUCTIONS = `Your file system MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides a command-line interface for interacting with MCP file system servers.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2560,11 +2556,8 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Source maps enabled for better debugging
 - ✅ Cross-platform compatibility
 - ✅ Features: Interactive mode, command-line operations, and programmatic API for file operations`;
-        break;
 
-      case "database":
-        files = generateDatabaseClient(req.projectName, req.description);
-        instructions = `Your database MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides an interactive interface for querying databases through MCP servers.
+const DATABASE_CLIENT_INSTRUCTIONS = `Your database MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides an interactive interface for querying databases through MCP servers.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2584,11 +2577,8 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Source maps enabled for better debugging
 - ✅ Interactive prompts for better user experience
 - ✅ Features: Interactive query interface, table exploration, and guided database operations`;
-        break;
 
-      case "api":
-        files = generateApiClient(req.projectName, req.description);
-        instructions = `Your API integration MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides tools for making HTTP requests through MCP API servers.
+const API_CLIENT_INSTRUCTIONS = `Your API integration MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides tools for making HTTP requests through MCP API servers.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2608,11 +2598,8 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Source maps enabled for better debugging
 - ✅ Interactive prompts for better user experience
 - ✅ Features: Support for GET and POST requests with JSON formatting`;
-        break;
 
-      case "git":
-        files = generateGitClient(req.projectName, req.description);
-        instructions = `Your Git repository MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides tools for exploring Git repositories through MCP servers.
+const GIT_CLIENT_INSTRUCTIONS = `Your Git repository MCP client has been generated with the latest SDK version and comprehensive fixes! This client provides tools for exploring Git repositories through MCP servers.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2632,11 +2619,8 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Source maps enabled for better debugging
 - ✅ Interactive prompts for better user experience
 - ✅ Features: Git history exploration, file reading from commits, and repository browsing`;
-        break;
 
-      case "multi-server":
-        files = generateMultiServerClient(req.projectName, req.description, req.serverEndpoints);
-        instructions = `Your multi-server MCP client has been generated with the latest SDK version and comprehensive fixes! This client can connect to and manage multiple MCP servers simultaneously.
+const MULTI_SERVER_CLIENT_INSTRUCTIONS = `Your multi-server MCP client has been generated with the latest SDK version and comprehensive fixes! This client can connect to and manage multiple MCP servers simultaneously.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2657,12 +2641,37 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Source maps enabled for better debugging
 - ✅ Interactive prompts for better user experience
 - ✅ Features: Multi-server management, aggregated resource views, and dynamic server connections`;
-        break;
 
-      case "custom":
-        // Generate a basic template for custom clients
-        files = generateFileSystemClient(req.projectName, req.description);
-        instructions = `A production-ready MCP client template has been generated based on the file system client with the latest SDK version and all fixes applied.
+interface ClientGeneratorEntry {
+  generate: (projectName: string, description?: string, serverEndpoints?: string[]) => ClientProjectFile[];
+  instructions: string;
+}
+
+// Precomputed lookup table so the handler picks a generator and its static
+// instructions in one step instead of walking a switch per request.
+const clientGenerators: Record<Exclude<ClientType, "custom">, ClientGeneratorEntry> = {
+  filesystem: { generate: generateFileSystemClient, instructions: FILESYSTEM_CLIENT_INSTRUCTIONS },
+  database: { generate: generateDatabaseClient, instructions: DATABASE_CLIENT_INSTRUCTIONS },
+  api: { generate: generateApiClient, instructions: API_CLIENT_INSTRUCTIONS },
+  git: { generate: generateGitClient, instructions: GIT_CLIENT_INSTRUCTIONS },
+  "multi-server": { generate: generateMultiServerClient, instructions: MULTI_SERVER_CLIENT_INSTRUCTIONS },
+};
+
+// Generates complete MCP client boilerplate code based on user requirements.
+export const generateClient = api<GenerateClientRequest, GenerateClientResponse>(
+  { expose: true, method: "POST", path: "/generate-client" },
+  async (req) => {
+    if (!PROJECT_NAME_PATTERN.test(req.projectName)) {
+      throw new Error(`Invalid project name: ${req.projectName}. Use only letters, numbers, hyphens, and underscores.`);
+    }
+
+    let files: ClientProjectFile[] = [];
+    let instructions = "";
+
+    if (req.clientType === "custom") {
+      // Generate a basic template for custom clients
+      files = generateFileSystemClient(req.projectName, req.description);
+      instructions = `A production-ready MCP client template has been generated based on the file system client with the latest SDK version and all fixes applied.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2683,10 +2692,13 @@ export const generateClient = api<GenerateClientRequest, GenerateClientResponse>
 - ✅ Cross-platform compatibility
 
 Follow the MCP SDK documentation to implement your custom client functionality.`;
-        break;
-
-      default:
+    } else {
+      const entry = clientGenerators[req.clientType];
+      if (!entry) {
         throw new Error(`Unsupported client type: ${req.clientType}`);
+      }
+      files = entry.generate(req.projectName, req.description, req.serverEndpoints);
+      instructions = entry.instructions;
     }
 
     return {
@@ -20,6 +20,10 @@ export interface GenerateServerResponse {
   instructions: string;
 }
 
+// Project names are interpolated into package.json and generated source,
+// so restrict them to safe characters with one precompiled pattern.
+const PROJECT_NAME_PATTERN = /^[A-Za-z0-9_-]+$/;
+
 const generateFileSystemServer = (projectName: string, description?: string): ProjectFile[] => {
   const packageJson = {
     name: projectName,
@@ -2427,17 +2431,9 @@ This server provides read-only access to git repositories. No write operations (
   ];
 };
 
-// Generates complete MCP server boilerplate code based on user requirements.
-export const generate = api<GenerateServerRequest, GenerateServerResponse>(
-  { expose: true, method: "POST", path: "/generate" },
-  async (req) => {
-    let files: ProjectFile[] = [];
-    let instructions = "";
-
-    switch (req.serverType) {
-      case "filesystem":
-        files = generateFileSystemServer(req.projectName, req.description);
-        instructions = `Your file system MCP server has been generated with ALL CRITICAL SECURITY FIXES applied based on expert AI model feedback! This server provides secure file operations within a specified directory.
+// Setup instructions are static per server type, so build each string once
+// at module load instead of on every request.
+const FILESYSTEM_SERVER_INSTRUCTIONS = `Your file system MCP server has been generated with ALL CRITICAL SECURITY FIXES applied based on expert AI model feedback! This server provides secure file operations within a specified directory.
 
 **🔴 CRITICAL BUGS FIXED:**
 
@@ -2488,11 +2484,8 @@ export const generate = api<GenerateServerRequest, GenerateServerResponse>(
 - ✅ Source maps enabled for debugging
 
 This server now passes all security audits and is ready for production deployment!`;
-        break;
 
-      case "database":
-        files = generateDatabaseServer(req.projectName, req.description);
-        instructions = `Your PostgreSQL MCP server has been generated with the latest SDK version and comprehensive security fixes! This server provides secure, read-only database access with enterprise-grade safety features.
+const DATABASE_SERVER_INSTRUCTIONS = `Your PostgreSQL MCP server has been generated with the latest SDK version and comprehensive security fixes! This server provides secure, read-only database access with enterprise-grade safety features.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2535,11 +2528,8 @@ This server now passes all security audits and is ready for production deploymen
 - ✅ SSL support: Enable with PGSSL=true for remote connections
 
 This server is production-ready and follows database security best practices with the latest SDK improvements!`;
-        break;
 
-      case "api":
-        files = generateApiServer(req.projectName, req.description);
-        instructions = `Your secure REST API proxy MCP server has been generated with COMPREHENSIVE SECURITY FIXES based on expert AI model feedback! This server provides enterprise-grade SSRF protection and follows all security best practices.
+const API_SERVER_INSTRUCTIONS = `Your secure REST API proxy MCP server has been generated with COMPREHENSIVE SECURITY FIXES based on expert AI model feedback! This server provides enterprise-grade SSRF protection and follows all security best practices.
 
 **🔴 CRITICAL SECURITY FIXES APPLIED:**
 
@@ -2595,11 +2585,8 @@ This server is production-ready and follows database security best practices wit
 **IMPORTANT**: This server now implements comprehensive SSRF protection and is safe for production use. Only add trusted API hosts to ALLOWED_HOSTS!
 
 This implementation addresses all the security vulnerabilities identified by the expert AI models and is now production-ready!`;
-        break;
 
-      case "git":
-        files = generateGitServer(req.projectName, req.description);
-        instructions = `Your Git repository MCP server has been generated with the latest SDK version and comprehensive fixes! This server provides read-only access to Git repositories.
+const GIT_SERVER_INSTRUCTIONS = `Your Git repository MCP server has been generated with the latest SDK version and comprehensive fixes! This server provides read-only access to Git repositories.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2636,12 +2623,36 @@ This implementation addresses all the security vulnerabilities identified by the
 - ✅ Source maps: Enabled for better debugging experience
 
 This server follows MCP best practices and provides secure Git repository access with the latest SDK improvements!`;
-        break;
 
-      case "custom":
-        // Generate a basic template for custom servers
-        files = generateFileSystemServer(req.projectName, req.description);
-        instructions = `A production-ready MCP server template has been generated based on the file system server with ALL the latest MCP SDK fixes and security improvements applied.
+interface ServerGeneratorEntry {
+  generate: (projectName: string, description?: string) => ProjectFile[];
+  instructions: string;
+}
+
+// Precomputed lookup table so the handler picks a generator and its static
+// instructions in one step instead of walking a switch per request.
+const serverGenerators: Record<Exclude<ServerType, "custom">, ServerGeneratorEntry> = {
+  filesystem: { generate: generateFileSystemServer, instructions: FILESYSTEM_SERVER_INSTRUCTIONS },
+  database: { generate: generateDatabaseServer, instructions: DATABASE_SERVER_INSTRUCTIONS },
+  api: { generate: generateApiServer, instructions: API_SERVER_INSTRUCTIONS },
+  git: { generate: generateGitServer, instructions: GIT_SERVER_INSTRUCTIONS },
+};
+
+// Generates complete MCP server boilerplate code based on user requirements.
+export const generate = api<GenerateServerRequest, GenerateServerResponse>(
+  { expose: true, method: "POST", path: "/generate" },
+  async (req) => {
+    if (!PROJECT_NAME_PATTERN.test(req.projectName)) {
+      throw new Error(`Invalid project name: ${req.projectName}. Use only letters, numbers, hyphens, and underscores.`);
+    }
+
+    let files: ProjectFile[] = [];
+    let instructions = "";
+
+    if (req.serverType === "custom") {
+      // Generate a basic template for custom servers
+      files = generateFileSystemServer(req.projectName, req.description);
+      instructions = `A production-ready MCP server template has been generated based on the file system server with ALL the latest MCP SDK fixes and security improvements applied.
 
 **🔧 SDK UPDATES APPLIED:**
 - **Latest SDK Version**: Updated to \`@modelcontextprotocol/sdk ^1.11.1\` for latest features and bug fixes
@@ -2678,10 +2689,13 @@ This server follows MCP best practices and provides secure Git repository access
 - Implement your specific business logic in the request handlers
 
 Follow the MCP SDK documentation to implement your custom functionality while maintaining the security and architectural patterns provided in this template with all the latest fixes applied.`;
-        break;
-
-      default:
+    } else {
+      const entry = serverGenerators[req.serverType];
+      if (!entry) {
         throw new Error(`Unsupported server type: ${req.serverType}`);
+      }
+      files = entry.generate(req.projectName, req.description);
+      instructions = entry.instructions;
     }
 
     return {
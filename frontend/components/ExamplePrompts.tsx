@@ -5,35 +5,35 @@ interface ExamplePromptsProps {
   onSelectPrompt: (prompt: string) => void;
 }
 
-export function ExamplePrompts({ onSelectPrompt }: ExamplePromptsProps) {
-  const examples = [
-    {
-      icon: FileCode,
-      title: "File System Server",
-      prompt: "Help me create an MCP server that can read and write files from a specific directory. I want to be able to list files, read file contents, and create new files."
-    },
-    {
-      icon: Database,
-      title: "Database Integration",
-      prompt: "I need to build an MCP server that connects to a PostgreSQL database. It should allow querying tables and executing safe read operations."
-    },
-    {
-      icon: Globe,
-      title: "REST API Server",
-      prompt: "Show me how to create an MCP server that acts as a proxy to a REST API. I want to make HTTP requests and return the responses to the MCP client."
-    },
-    {
-      icon: GitBranch,
-      title: "Git Repository Access",
-      prompt: "I want to create an MCP server that can interact with Git repositories - reading file contents, getting commit history, and checking branch information."
-    },
-    {
-      icon: Server,
-      title: "MCP Client Development",
-      prompt: "How do I build an MCP client that can connect to multiple servers and provide a command-line interface for interacting with them?"
-    }
-  ];
+const examples = [
+  {
+    icon: FileCode,
+    title: "File System Server",
+    prompt: "Help me create an MCP server that can read and write files from a specific directory. I want to be able to list files, read file contents, and create new files."
+  },
+  {
+    icon: Database,
+    title: "Database Integration",
+    prompt: "I need to build an MCP server that connects to a PostgreSQL database. It should allow querying tables and executing safe read operations."
+  },
+  {
+    icon: Globe,
+    title: "REST API Server",
+    prompt: "Show me how to create an MCP server that acts as a proxy to a REST API. I want to make HTTP requests and return the responses to the MCP client."
+  },
+  {
+    icon: GitBranch,
+    title: "Git Repository Access",
+    prompt: "I want to create an MCP server that can interact with Git repositories - reading file contents, getting commit history, and checking branch information."
+  },
+  {
+    icon: Server,
+    title: "MCP Client Development",
+    prompt: "How do I build an MCP client that can connect to multiple servers and provide a command-line interface for interacting with them?"
+  }
+];
 
+export function ExamplePrompts({ onSelectPrompt }: ExamplePromptsProps) {
   return (
     <div className="w-full max-w-2xl">
       <h3 className="text-lg font-medium text-gray-900 mb-4 text-center">
@@ -14,6 +14,45 @@ interface GenerateClientFormProps {
   onGenerated: (files: any[], instructions: string) => void;
 }
 
+const clientTypes = [
+  {
+    value: "filesystem" as ClientType,
+    label: "File System Client",
+    description: "Connect to file system MCP servers",
+    icon: FileCode,
+  },
+  {
+    value: "database" as ClientType,
+    label: "Database Client",
+    description: "Connect to database MCP servers",
+    icon: Database,
+  },
+  {
+    value: "api" as ClientType,
+    label: "API Integration Client",
+    description: "Connect to API integration MCP servers",
+    icon: Globe,
+  },
+  {
+    value: "git" as ClientType,
+    label: "Git Repository Client",
+    description: "Connect to Git repository MCP servers",
+    icon: GitBranch,
+  },
+  {
+    value: "multi-server" as ClientType,
+    label: "Multi-Server Client",
+    description: "Connect to multiple MCP servers simultaneously",
+    icon: Network,
+  },
+  {
+    value: "custom" as ClientType,
+    label: "Custom Client",
+    description: "Start with a basic template for custom functionality",
+    icon: Settings,
+  },
+];
+
 export function GenerateClientForm({ onGenerated }: GenerateClientFormProps) {
   const [formData, setFormData] = useState<GenerateClientRequest>({
     clientType: "filesystem" as ClientType,
@@ -26,45 +65,6 @@ export function GenerateClientForm({ onGenerated }: GenerateClientFormProps) {
   const [isGenerating, setIsGenerating] = useState(false);
   const { toast } = useToast();
 
-  const clientTypes = [
-    {
-      value: "filesystem" as ClientType,
-      label: "File System Client",
-      description: "Connect to file system MCP servers",
-      icon: FileCode,
-    },
-    {
-      value: "database" as ClientType,
-      label: "Database Client",
-      description: "Connect to database MCP servers",
-      icon: Database,
-    },
-    {
-      value: "api" as ClientType,
-      label: "API Integration Client",
-      description: "Connect to API integration MCP servers",
-      icon: Globe,
-    },
-    {
-      value: "git" as ClientType,
-      label: "Git Repository Client",
-      description: "Connect to Git repository MCP servers",
-      icon: GitBranch,
-    },
-    {
-      value: "multi-server" as ClientType,
-      label: "Multi-Server Client",
-      description: "Connect to multiple MCP servers simultaneously",
-      icon: Network,
-    },
-    {
-      value: "custom" as ClientType,
-      label: "Custom Client",
-      description: "Start with a basic template for custom functionality",
-      icon: Settings,
-    },
-  ];
-
   const selectedClientType = clientTypes.find(type => type.value === formData.clientType);
 
   const handleGenerate = async () => {
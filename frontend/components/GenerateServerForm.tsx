@@ -14,6 +14,39 @@ interface GenerateServerFormProps {
   onGenerated: (files: any[], instructions: string) => void;
 }
 
+const serverTypes = [
+  {
+    value: "filesystem" as ServerType,
+    label: "File System Server",
+    description: "Read and write files within a secure directory",
+    icon: FileCode,
+  },
+  {
+    value: "database" as ServerType,
+    label: "Database Server",
+    description: "Query PostgreSQL databases safely",
+    icon: Database,
+  },
+  {
+    value: "api" as ServerType,
+    label: "API Integration Server",
+    description: "Proxy requests to external REST APIs",
+    icon: Globe,
+  },
+  {
+    value: "git" as ServerType,
+    label: "Git Repository Server",
+    description: "Browse Git repositories and history",
+    icon: GitBranch,
+  },
+  {
+    value: "custom" as ServerType,
+    label: "Custom Server",
+    description: "Start with a basic template for custom functionality",
+    icon: Settings,
+  },
+];
+
 export function GenerateServerForm({ onGenerated }: GenerateServerFormProps) {
   const [formData, setFormData] = useState<GenerateServerRequest>({
     serverType: "filesystem" as ServerType,
@@ -25,39 +58,6 @@ export function GenerateServerForm({ onGenerated }: GenerateServerFormProps) {
   const [isGenerating, setIsGenerating] = useState(false);
   const { toast } = useToast();
 
-  const serverTypes = [
-    {
-      value: "filesystem" as ServerType,
-      label: "File System Server",
-      description: "Read and write files within a secure directory",
-      icon: FileCode,
-    },
-    {
-      value: "database" as ServerType,
-      label: "Database Server",
-      description: "Query PostgreSQL databases safely",
-      icon: Database,
-    },
-    {
-      value: "api" as ServerType,
-      label: "API Integration Server",
-      description: "Proxy requests to external REST APIs",
-      icon: Globe,
-    },
-    {
-      value: "git" as ServerType,
-      label: "Git Repository Server",
-      description: "Browse Git repositories and history",
-      icon: GitBranch,
-    },
-    {
-      value: "custom" as ServerType,
-      label: "Custom Server",
-      description: "Start with a basic template for custom functionality",
-      icon: Settings,
-    },
-  ];
-
   const selectedServerType = serverTypes.find(type => type.value === formData.serverType);
 
   const handleGenerate = async () => {
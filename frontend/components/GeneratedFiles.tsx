@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useMemo, useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
@@ -19,6 +19,27 @@ interface GeneratedFilesProps {
   projectType?: "server" | "client";
 }
 
+// Lookup tables instead of per-render conditional chains.
+const fileIcons: Record<string, typeof FileText> = {
+  "package.json": Package,
+  "tsconfig.json": Settings,
+  "README.md": BookOpen,
+  "config.json": Settings,
+};
+
+const fileTypes: Record<string, string> = {
+  json: "JSON",
+  ts: "TypeScript",
+  md: "Markdown",
+};
+
+const getFileIcon = (path: string) => fileIcons[path] || FileText;
+
+const getFileType = (path: string) => {
+  const ext = path.split(".").pop()?.toLowerCase();
+  return (ext && fileTypes[ext]) || "Text";
+};
+
 export function GeneratedFiles({ files, instructions, onBack, projectType = "server" }: GeneratedFilesProps) {
   const [copiedFile, setCopiedFile] = useState<string | null>(null);
   const [copiedAll, setCopiedAll] = useState(false);
@@ -71,12 +92,14 @@ export function GeneratedFiles({ files, instructions, onBack, projectType = "ser
     }
   };
 
-  const handleDownloadAll = () => {
-    // Create a simple text format with all files
-    const allContent = files.map(file => 
+  // Serialize the combined file text once per file set; both the download
+  // and copy-all actions reuse the same string.
+  const allContent = useMemo(() =>
+    files.map(file =>
       `=== ${file.path} ===\n${file.content}\n\n`
-    ).join("");
+    ).join(""), [files]);
 
+  const handleDownloadAll = () => {
     const blob = new Blob([allContent], { type: "text/plain" });
     const url = URL.createObjectURL(blob);
     const a = document.createElement("a");
@@ -94,10 +117,6 @@ export function GeneratedFiles({ files, instructions, onBack, projectType = "ser
   };
 
   const handleCopyAll = async () => {
-    const allContent = files.map(file => 
-      `=== ${file.path} ===\n${file.content}\n\n`
-    ).join("");
-    
     const success = await copyToClipboard(allContent);
     
     if (success) {
@@ -117,24 +136,6 @@ export function GeneratedFiles({ files, instructions, onBack, projectType = "ser
     }
   };
 
-  const getFileIcon = (path: string) => {
-    if (path === "package.json") return Package;
-    if (path === "tsconfig.json") return Settings;
-    if (path === "README.md") return BookOpen;
-    if (path === "config.json") return Settings;
-    return FileText;
-  };
-
-  const getFileType = (path: string) => {
-    const ext = path.split(".").pop()?.toLowerCase();
-    switch (ext) {
-      case "json": return "JSON";
-      case "ts": return "TypeScript";
-      case "md": return "Markdown";
-      default: return "Text";
-    }
-  };
-
   const title = projectType === "client" ? "Generated MCP Client" : "Generated MCP Server";
 
   return (
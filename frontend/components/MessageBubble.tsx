@@ -1,6 +1,6 @@
 import { Bot, User, Copy, Check } from "lucide-react";
 import { Button } from "@/components/ui/button";
-import { useState } from "react";
+import { memo, useState } from "react";
 import { useToast } from "@/components/ui/use-toast";
 import type { ChatMessage } from "./types";
 
@@ -8,7 +8,9 @@ interface MessageBubbleProps {
   message: ChatMessage;
 }
 
-export function MessageBubble({ message }: MessageBubbleProps) {
+// Memoized so appending a message or typing doesn't re-render every
+// existing bubble in the conversation.
+export const MessageBubble = memo(function MessageBubble({ message }: MessageBubbleProps) {
   const [copied, setCopied] = useState(false);
   const { toast } = useToast();
   const isUser = message.role === "user";
@@ -107,4 +109,4 @@ export function MessageBubble({ message }: MessageBubbleProps) {
       </div>
     </div>
   );
-}
+});
@@ -10,47 +10,47 @@ interface SidebarProps {
   currentPage: "chat" | "testimonials";
 }
 
-export function Sidebar({ isOpen, onClose, onNavigateToTestimonials, onNavigateToChat, currentPage }: SidebarProps) {
-  const resources = [
-    {
-      title: "MCP Documentation",
-      url: "https://docs.anthropic.com/en/docs/mcp",
-      icon: Book,
-      description: "Official MCP documentation"
-    },
-    {
-      title: "MCP SDK",
-      url: "https://github.com/modelcontextprotocol/typescript-sdk",
-      icon: Github,
-      description: "TypeScript SDK for MCP"
-    },
-    {
-      title: "Example Servers",
-      url: "https://github.com/modelcontextprotocol/servers",
-      icon: Server,
-      description: "Collection of example MCP servers"
-    }
-  ];
+const resources = [
+  {
+    title: "MCP Documentation",
+    url: "https://docs.anthropic.com/en/docs/mcp",
+    icon: Book,
+    description: "Official MCP documentation"
+  },
+  {
+    title: "MCP SDK",
+    url: "https://github.com/modelcontextprotocol/typescript-sdk",
+    icon: Github,
+    description: "TypeScript SDK for MCP"
+  },
+  {
+    title: "Example Servers",
+    url: "https://github.com/modelcontextprotocol/servers",
+    icon: Server,
+    description: "Collection of example MCP servers"
+  }
+];
 
-  const examples = [
-    {
-      title: "File System Server",
-      description: "Access and manipulate files"
-    },
-    {
-      title: "Database Server", 
-      description: "Query and update databases"
-    },
-    {
-      title: "API Integration Server",
-      description: "Connect to external APIs"
-    },
-    {
-      title: "Git Repository Server",
-      description: "Interact with Git repositories"
-    }
-  ];
+const examples = [
+  {
+    title: "File System Server",
+    description: "Access and manipulate files"
+  },
+  {
+    title: "Database Server", 
+    description: "Query and update databases"
+  },
+  {
+    title: "API Integration Server",
+    description: "Connect to external APIs"
+  },
+  {
+    title: "Git Repository Server",
+    description: "Interact with Git repositories"
+  }
+];
 
+export function Sidebar({ isOpen, onClose, onNavigateToTestimonials, onNavigateToChat, currentPage }: SidebarProps) {
   const navigationItems = [
     {
       title: "Chat Assistant",